@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 
 class Settings(BaseSettings):
     ENV: str = "DEV"
+    DEBUG: bool = False
 
     API_KEY: str
 
@@ -1,22 +1,34 @@
 import logging
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 
+from app.agent import start_prewarm
 from app.config import setup_logging
 from app.models.response_models import TemplateJSONResponse
 from app.routers.api import api_router
+from app.services.sports_service import close_client
 
 setup_logging()
 
 # 데이터 디렉토리
 os.makedirs(os.path.join(os.getcwd(), "data", "memory"), exist_ok=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 에이전트 의존 모듈을 백그라운드에서 미리 로드
+    start_prewarm()
+    yield
+    # 공용 HTTP 클라이언트 정리
+    await close_client()
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="PrediX Agent Server",
         version="0.3.0",
         default_response_class=TemplateJSONResponse,
+        lifespan=lifespan,
     )
     app.include_router(api_router)
     logging.info("LangGraph Predix agent initialized successfully")
@@ -1,12 +1,17 @@
-import json
 import logging
 import os
+import threading
 from datetime import datetime
 from typing import Any
 
+import orjson
+
 # 메모리 스토어 (인메모리 캐시)
 _memory_store: dict[str, list[dict[str, Any]]] = {}
 
+# 파일 쓰기 직렬화 (백그라운드 스레드에서 호출될 수 있음)
+_write_lock = threading.Lock()
+
 def get_memory_path(conversation_id: str) -> str:
     """
     대화 메모리 파일 경로 가져오기
@@ -18,7 +23,29 @@ def get_memory_path(conversation_id: str) -> str:
     os.makedirs(memory_dir, exist_ok=True)
     return os.path.join(memory_dir, f"{conversation_id}.json")
 
-def save_message(conversation_id: str, role: str, content: str) -> None:
+def persist_messages(conversation_id: str) -> None:
+    """
+    메모리의 대화 내용을 파일에 저장
+
+    Args:
+        conversation_id: 대화 ID
+    """
+    try:
+        with _write_lock:
+            file_path = get_memory_path(conversation_id)
+            data = {
+                "conversation_id": conversation_id,
+                "messages": list(_memory_store.get(conversation_id, [])),
+                "updated_at": datetime.now().isoformat()
+            }
+
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+    except Exception as e:
+        logging.error(f"Error saving messages to file: {str(e)}")
+
+def save_message(conversation_id: str, role: str, content: str, persist: bool = True) -> None:
     """
     메시지 저장 (메모리와 파일 모두)
 
@@ -26,6 +53,7 @@ def save_message(conversation_id: str, role: str, content: str) -> None:
         conversation_id: 대화 ID
         role: 역할 (user/assistant/system)
         content: 메시지 내용
+        persist: False면 메모리에만 추가 (파일 저장은 persist_messages로 별도 수행)
     """
     if conversation_id not in _memory_store:
         _memory_store[conversation_id] = []
@@ -42,22 +70,11 @@ def save_message(conversation_id: str, role: str, content: str) -> None:
     _memory_store[conversation_id].append(message)
 
     # 파일에 저장
-    try:
-        file_path = get_memory_path(conversation_id)
-        data = {
-            "conversation_id": conversation_id,
-            "messages": _memory_store[conversation_id],
-            "updated_at": datetime.now().isoformat()
-        }
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-    except Exception as e:
-        logging.error(f"Error saving message to file: {str(e)}")
+    if persist:
+        persist_messages(conversation_id)
 
 def save_tool_message(conversation_id: str, tool_call_id: str, content: str,
-                      status: str = "success", artifact: Any | None = None) -> None:
+                      status: str = "success", artifact: Any | None = None, persist: bool = True) -> None:
     """
     도구 메시지 저장 (메모리와 파일 모두)
     모든 메시지가 _memory_store에 통합되어 저장됨
@@ -68,6 +85,7 @@ def save_tool_message(conversation_id: str, tool_call_id: str, content: str,
         content: 메시지 내용
         status: 도구 실행 상태 ('success' 또는 'error')
         artifact: 추가 데이터
+        persist: False면 메모리에만 추가 (파일 저장은 persist_messages로 별도 수행)
     """
     if conversation_id not in _memory_store:
         _memory_store[conversation_id] = []
@@ -90,19 +108,8 @@ def save_tool_message(conversation_id: str, tool_call_id: str, content: str,
     _memory_store[conversation_id].append(tool_message)
 
     # 파일에 저장
-    try:
-        file_path = get_memory_path(conversation_id)
-        data = {
-            "conversation_id": conversation_id,
-            "messages": _memory_store[conversation_id],
-            "updated_at": datetime.now().isoformat()
-        }
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-    except Exception as e:
-        logging.error(f"Error saving tool message to file: {str(e)}")
+    if persist:
+        persist_messages(conversation_id)
 
 def get_memory_messages(conversation_id: str) -> list[dict[str, str]]:
     """
@@ -124,8 +131,8 @@ def get_memory_messages(conversation_id: str) -> list[dict[str, str]]:
     file_path = get_memory_path(conversation_id)
     if os.path.exists(file_path):
         try:
-            with open(file_path) as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                data = orjson.loads(f.read())
 
                 messages = data.get("messages", [])
                 _memory_store[conversation_id] = messages
@@ -161,8 +168,8 @@ def get_tool_messages(conversation_id: str) -> list[dict[str, Any]]:
     file_path = get_memory_path(conversation_id)
     if os.path.exists(file_path):
         try:
-            with open(file_path) as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                data = orjson.loads(f.read())
 
                 messages = data.get("messages", [])
                 _memory_store[conversation_id] = messages
@@ -190,8 +197,8 @@ def get_formatted_messages(conversation_id: str) -> list[dict[str, Any]]:
         file_path = get_memory_path(conversation_id)
         if os.path.exists(file_path):
             try:
-                with open(file_path) as f:
-                    data = json.load(f)
+                with open(file_path, "rb") as f:
+                    data = orjson.loads(f.read())
                     _memory_store[conversation_id] = data.get("messages", [])
             except Exception as e:
                 logging.error(f"Error loading messages from file: {str(e)}")
@@ -243,8 +250,8 @@ def get_raw_messages(conversation_id: str) -> list[dict[str, Any]]:
     file_path = get_memory_path(conversation_id)
     if os.path.exists(file_path):
         try:
-            with open(file_path) as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                data = orjson.loads(f.read())
                 messages = data.get("messages", [])
                 _memory_store[conversation_id] = messages
                 return messages
@@ -1,10 +1,13 @@
+import asyncio
+import bisect
+import functools
 import logging
-from datetime import datetime, timedelta
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import httpx
-import pytz
-from dateutil import parser
 
 from app.config import settings
 
@@ -14,8 +17,125 @@ API_HEADERS = {
     'x-apisports-key': settings.SPORTS_API_KEY
 }
 
+# 커넥션 재사용을 위한 공용 HTTP 클라이언트
+_client = httpx.AsyncClient(base_url=API_BASE_URL, headers=API_HEADERS)
 
-async def search_teams(query: str) -> list[dict[str, Any]]:
+# 에러 경로에서 공유하는 빈 결과 (호출자는 결과를 변경하지 않음)
+_EMPTY: tuple = ()
+
+# 진행 중인 동일 요청 (single-flight)
+_inflight: dict[tuple, asyncio.Task] = {}
+
+# 응답 캐시 (요청 키 -> (만료 시각, 응답)), 엔드포인트별 TTL(초)
+RESPONSE_CACHE_TTLS = {
+    "/teams": 3600,
+    "/leagues": 3600,
+    "/fixtures": 600,
+}
+RESPONSE_CACHE_MAXSIZE = 4096
+_response_cache: dict[tuple, tuple[float, Sequence[dict[str, Any]]]] = {}
+
+# API 동시 요청 수 제한 (api-sports.io 요청 한도 보호)
+MAX_CONCURRENT_REQUESTS = 8
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _fixture_timestamp(fixture: dict[str, Any]) -> int:
+    return fixture["fixture"]["timestamp"]
+
+
+def _request_key(path: str, params: dict[str, Any]) -> tuple:
+    # 검색어는 대소문자/공백 차이를 무시 (api-sports 검색은 대소문자 구분 없음)
+    return path, tuple(sorted(
+        (name, " ".join(value.split()).lower() if name == "search" and isinstance(value, str) else value)
+        for name, value in params.items()
+    ))
+
+
+async def close_client() -> None:
+    """
+    공용 HTTP 클라이언트 종료 (앱 종료 시 호출)
+    """
+    await _client.aclose()
+
+
+async def _request(path: str, params: dict[str, Any], action: str) -> Sequence[dict[str, Any]]:
+    """
+    Call an api-sports.io endpoint and return its 'response' list.
+
+    Args:
+        path: Endpoint path (e.g. "/teams")
+        params: Query parameters
+        action: Description used in error logs (e.g. "searching teams")
+
+    Returns:
+        List of response items, or an empty sequence on error
+    """
+    try:
+        async with _request_semaphore:
+            response = await _client.get(path, params=params)
+
+        if response.status_code == 200:
+            data = response.json()
+            return data.get("response", _EMPTY)
+        else:
+            logging.error(f"API error {action}: {response.status_code} - {response.text}")
+            return _EMPTY
+    except Exception as e:
+        logging.error(f"Error {action}: {e}")
+        return _EMPTY
+
+
+async def _fetch(path: str, params: dict[str, Any], action: str) -> Sequence[dict[str, Any]]:
+    """
+    Serve a request from the response cache, or coalesce concurrent identical
+    requests onto a single network call running as its own task, so that a
+    cancelled caller does not cancel the request for the others.
+
+    Args:
+        path: Endpoint path (e.g. "/teams")
+        params: Query parameters
+        action: Description used in error logs
+
+    Returns:
+        List of response items shared by every caller of the same request
+    """
+    key = _request_key(path, params)
+
+    # 캐시된 응답이 유효하면 재사용
+    cached = _response_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    # 동일한 요청이 진행 중이 아니면 독립된 작업으로 시작
+    # (호출자 중 누가 취소되어도 공유 요청은 계속 진행)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_request(path, params, action))
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_on_fetch_done, key, path))
+
+    return await asyncio.shield(task)
+
+
+def _on_fetch_done(key: tuple, path: str, task: asyncio.Task) -> None:
+    """
+    공유 요청 완료 시 진행 중 목록에서 제거하고 결과를 캐시에 저장
+    """
+    _inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+
+    # 빈 결과(에러 포함)는 캐시하지 않음, 최대 크기 초과 시 가장 오래된 항목 제거
+    result = task.result()
+    if result:
+        _response_cache.pop(key, None)
+        if len(_response_cache) >= RESPONSE_CACHE_MAXSIZE:
+            _response_cache.pop(next(iter(_response_cache)))
+        _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTLS.get(path, 0), result)
+
+
+async def search_teams(query: str) -> Sequence[dict[str, Any]]:
     """
     Search for football teams by name using the api-sports.io API.
 
@@ -27,24 +147,7 @@ async def search_teams(query: str) -> list[dict[str, Any]]:
     """
     # logging.info(f"Searching for teams with query: {query}")
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_BASE_URL}/teams",
-                headers=API_HEADERS,
-                params={"search": query}
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                # logging.info(f"Found {data.get('results', 0)} teams matching '{query}'")
-                return data.get("response", [])
-            else:
-                logging.error(f"API error searching teams: {response.status_code} - {response.text}")
-                return []
-    except Exception as e:
-        logging.error(f"Error searching teams: {e}")
-        return []
+    return await _fetch("/teams", {"search": query}, "searching teams")
 
 
 async def get_fixtures(
@@ -55,7 +158,7 @@ async def get_fixtures(
         to_date: str | None = None,
         fixture_id: int | None = None,
         upcoming: bool = True
-) -> list[dict[str, Any]]:
+) -> Sequence[dict[str, Any]]:
     """
     Get football fixtures by team, league, date, or fixture ID using the api-sports.io API.
 
@@ -117,50 +220,29 @@ async def get_fixtures(
             # logging.info(f"Getting fixtures for league ID: {league_id}")
             params["league"] = league_id
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_BASE_URL}/fixtures",
-                headers=API_HEADERS,
-                params=params
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                fixtures = data.get("response", [])
-                # logging.info(f"Found {len(fixtures)} fixtures matching criteria")
-
-                # Return filtered results based on upcoming flag if not using fixture_id
-                if not fixture_id and fixtures:
-                    now = datetime.now(pytz.UTC)
-
-                    if upcoming:
-                        # Filter for upcoming fixtures
-                        return [
-                            fixture for fixture in fixtures
-                            if parser.parse(fixture["fixture"]["date"]) > now
-                        ]
-                    else:
-                        # Filter for past fixtures
-                        return [
-                            fixture for fixture in fixtures
-                            if parser.parse(fixture["fixture"]["date"]) <= now
-                        ]
-
-                return fixtures
-            else:
-                logging.error(f"API error getting fixtures: {response.status_code} - {response.text}")
-                return []
-    except Exception as e:
-        logging.error(f"Error getting fixtures: {e}")
-        return []
+    fixtures = await _fetch("/fixtures", params, "getting fixtures")
+    # logging.info(f"Found {len(fixtures)} fixtures matching criteria")
+
+    # Return filtered results based on upcoming flag if not using fixture_id
+    if not fixture_id and fixtures:
+        now_ts = datetime.now(UTC).timestamp()
+
+        # Sort defensively by kickoff timestamp (into a new list, the fetched one is shared),
+        # then split at "now" with a binary search
+        fixtures = sorted(fixtures, key=_fixture_timestamp)
+        split_idx = bisect.bisect_right(fixtures, now_ts, key=_fixture_timestamp)
+
+        # Upcoming fixtures start after now, past fixtures at or before it
+        return fixtures[split_idx:] if upcoming else fixtures[:split_idx]
+
+    return fixtures
 
 
 async def get_leagues(
         country: str | None = None,
         search: str | None = None,
         league_id: int | None = None
-) -> list[dict[str, Any]]:
+) -> Sequence[dict[str, Any]]:
     """
     Get football leagues information.
 
@@ -182,25 +264,38 @@ async def get_leagues(
     if league_id:
         params["id"] = league_id
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_BASE_URL}/leagues",
-                headers=API_HEADERS,
-                params=params
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                leagues = data.get("response", [])
-                # logging.info(f"Found {len(leagues)} leagues matching criteria")
-                return leagues
-            else:
-                logging.error(f"API error getting leagues: {response.status_code} - {response.text}")
-                return []
-    except Exception as e:
-        logging.error(f"Error getting leagues: {e}")
-        return []
+    leagues = await _fetch("/leagues", params, "getting leagues")
+    # logging.info(f"Found {len(leagues)} leagues matching criteria")
+    return leagues
+
+
+async def get_teams_fixtures(team_ids: list[int], upcoming: bool = True) -> list[dict[str, Any]]:
+    """
+    Get fixtures for several teams at once, fetching each team concurrently.
+
+    Args:
+        team_ids: Team IDs to get fixtures for
+        upcoming: If True, get upcoming fixtures; if False, get past fixtures
+
+    Returns:
+        Fixtures of all teams, deduplicated by fixture ID in first-seen order
+    """
+    # 같은 팀 ID가 여러 번 들어와도 한 번만 조회 (순서 유지)
+    fixture_results = await asyncio.gather(
+        *(get_fixtures(team_id=team_id, upcoming=upcoming) for team_id in dict.fromkeys(team_ids)),
+        return_exceptions=True
+    )
+
+    # 팀끼리 맞붙는 경기는 양쪽 결과에 모두 포함되므로 fixture ID로 중복 제거
+    fixtures_by_id = {}
+    for team_fixtures in fixture_results:
+        if isinstance(team_fixtures, BaseException):
+            logging.error(f"Error getting team fixtures: {team_fixtures}")
+            continue
+        for fixture in team_fixtures:
+            fixtures_by_id.setdefault(fixture["fixture"]["id"], fixture)
+
+    return list(fixtures_by_id.values())
 
 
 async def get_fixture_details(fixture_id: int) -> dict[str, Any]:
@@ -1,10 +1,26 @@
-from .market_tools import dp_market_finalized, dp_asking_options
-from .sports_tools import fixture_search_tool, league_search_tool, team_search_tool
-
-__all__ = [
-    'league_search_tool',
-    'team_search_tool',
-    'fixture_search_tool',
-    'dp_market_finalized',
-    'dp_asking_options',
-]
\ No newline at end of file
+import importlib
+
+# 속성 이름 -> (모듈, 속성) 매핑 (첫 접근 시 임포트)
+_LAZY = {
+    'league_search_tool': ('app.tools.sports_tools', 'league_search_tool'),
+    'team_search_tool': ('app.tools.sports_tools', 'team_search_tool'),
+    'fixture_search_tool': ('app.tools.sports_tools', 'fixture_search_tool'),
+    'dp_market_finalized': ('app.tools.market_tools', 'dp_market_finalized'),
+    'dp_asking_options': ('app.tools.market_tools', 'dp_asking_options'),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -4,7 +4,10 @@ from langchain.tools import StructuredTool
 from app.services.sports_service import get_fixture_details
 from datetime import datetime
 
-from app.models.market import Selection
+from app.models.market import Selection, SelectionType
+
+# SelectionType -> 직렬화 문자열 매핑
+SELECTION_TYPE_VALUES = {selection_type: selection_type.value for selection_type in SelectionType}
 
 async def get_formatted_fixture_data(fixture_id: int) -> dict:
     """
@@ -23,40 +26,89 @@ async def get_formatted_fixture_data(fixture_id: int) -> dict:
         raise ValueError(f"Could not find fixture with ID: {fixture_id}")
 
     # 경기 정보에서 필요한 데이터 추출
-    home_team_id = fixture_data["teams"]["home"]["id"]
-    home_team_name = fixture_data["teams"]["home"]["name"]
-    home_team_thumbnail = fixture_data["teams"]["home"]["logo"]
-    away_team_id = fixture_data["teams"]["away"]["id"]
-    away_team_name = fixture_data["teams"]["away"]["name"]
-    away_team_thumbnail = fixture_data["teams"]["away"]["logo"]
-    league_id = fixture_data["league"]["id"]
-    league_name = fixture_data["league"]["name"]
-    league_country = fixture_data["league"]["country"]
-    match_date = fixture_data["fixture"]["date"]
+    teams = fixture_data["teams"]
+    home = teams["home"]
+    away = teams["away"]
+    league = fixture_data["league"]
+    fixture = fixture_data["fixture"]
 
     # 경기장 정보 가져오기
-    venue_name = "Unknown Venue"
-    venue_city = "Unknown City"
-    if "venue" in fixture_data["fixture"] and fixture_data["fixture"]["venue"]:
-        venue_name = fixture_data["fixture"]["venue"].get("name", "Unknown Venue")
-        venue_city = fixture_data["fixture"]["venue"].get("city", "Unknown City")
-    
-    return {
-        "home_team_id": home_team_id,
-        "home_team_name": home_team_name,
-        "home_team_thumbnail": home_team_thumbnail,
-        "away_team_id": away_team_id,
-        "away_team_name": away_team_name,
-        "away_team_thumbnail": away_team_thumbnail,
-        "league_id": league_id,
-        "league_name": league_name,
-        "league_country": league_country,
-        "match_date": match_date,
-        "venue_name": venue_name,
-        "venue_city": venue_city,
+    venue = fixture.get("venue") or {}
+
+    fixture_info = {
+        "home_team_id": home["id"],
+        "home_team_name": home["name"],
+        "home_team_thumbnail": home["logo"],
+        "away_team_id": away["id"],
+        "away_team_name": away["name"],
+        "away_team_thumbnail": away["logo"],
+        "league_id": league["id"],
+        "league_name": league["name"],
+        "league_country": league["country"],
+        "match_date": fixture["date"],
+        "venue_name": venue.get("name", "Unknown Venue"),
+        "venue_city": venue.get("city", "Unknown City"),
         "fixture_id": fixture_id
     }
 
+    return fixture_info
+
+def build_market_package(
+        fixture_info: dict,
+        selections_data: list[Selection],
+        amount: float,
+        currency: str,
+) -> dict:
+    """
+    asking_options와 market_finalized가 공유하는 market/selections/event 데이터 생성
+
+    Args:
+        fixture_info: get_formatted_fixture_data로 포맷팅된 경기 정보
+        selections_data: list[Selection] 선택 옵션 데이터
+        amount: 베팅 금액
+        currency: 토큰
+
+    Returns:
+        직렬화 가능한 마켓 패키지 딕셔너리 (Enum 값 직접 설정)
+    """
+    home_team_name = fixture_info['home_team_name']
+    away_team_name = fixture_info['away_team_name']
+    match_date = fixture_info['match_date']
+    home_team_thumbnail = fixture_info['home_team_thumbnail']
+    away_team_thumbnail = fixture_info['away_team_thumbnail']
+
+    return {
+        "market": {
+            "title": f"{home_team_name} vs {away_team_name} Match Prediction",
+            "description": f"Prediction market for the match between {home_team_name} and {away_team_name} on {match_date}",
+            "type": "binary",
+            "status": "draft",
+            "category": "sports",
+            "amount": amount,
+            "currency": currency,
+            "close_date": match_date,
+            "created_at": datetime.now().isoformat(),
+        },
+        "selections": [
+            {
+                "name": selection.name,
+                "type": SELECTION_TYPE_VALUES[selection.type],
+                "description": selection.description,
+                "thumbnail": home_team_thumbnail if selection.type is SelectionType.WIN else away_team_thumbnail
+            }
+            for selection in selections_data
+        ],
+        "event": {
+            "type": "football_match",
+            "fixture_id": fixture_info['fixture_id'],
+            "home_team": {"id": fixture_info['home_team_id'], "name": home_team_name},
+            "away_team": {"id": fixture_info['away_team_id'], "name": away_team_name},
+            "league": {"id": fixture_info['league_id'], "name": fixture_info['league_name'], "country": fixture_info['league_country']},
+            "start_time": match_date,
+            "venue": {"name": fixture_info['venue_name'], "city": fixture_info['venue_city']},
+        },
+    }
+
 async def asking_options(
     selections_data: list[Selection],
     fixture_id: int,
@@ -74,54 +126,9 @@ async def asking_options(
     try:
         # 공통 함수를 사용하여 경기 정보 가져오기
         fixture_info = await get_formatted_fixture_data(fixture_id)
-        
-        # 직렬화 가능한 딕셔너리 생성(Enum 값 직접 설정)
-        serialized_data = {
-            "market": {
-                "title": f"{fixture_info['home_team_name']} vs {fixture_info['away_team_name']} Match Prediction",
-                "description": f"Prediction market for the match between {fixture_info['home_team_name']} and {fixture_info['away_team_name']} on {fixture_info['match_date']}",
-                "type": "binary",
-                "status": "draft",
-                "category": "sports",
-                "amount": 1.0,
-                "currency": "SOL",
-                "close_date": fixture_info['match_date'],
-                "created_at": datetime.now().isoformat()
-            },
-            "selections": [
-                {
-                    "name": selection.name,
-                    "type": selection.type.value,
-                    "description": selection.description,
-                    "thumbnail": fixture_info['home_team_thumbnail'] if selection.type.value == "win" else fixture_info['away_team_thumbnail']
-                }
-                for selection in selections_data
-            ],
-            "event": {
-                "type": "football_match",
-                "fixture_id": fixture_id,
-                "home_team": {
-                    "id": fixture_info['home_team_id'],
-                    "name": fixture_info['home_team_name']
-                },
-                "away_team": {
-                    "id": fixture_info['away_team_id'],
-                    "name": fixture_info['away_team_name']
-                },
-                "league": {
-                    "id": fixture_info['league_id'],
-                    "name": fixture_info['league_name'],
-                    "country": fixture_info['league_country']
-                },
-                "start_time": fixture_info['match_date'],
-                "venue": {
-                    "name": fixture_info['venue_name'],
-                    "city": fixture_info['venue_city']
-                }
-            }
-        }
 
-        return serialized_data
+        # 옵션 선택 단계에서는 기본 베팅 금액/토큰 사용
+        return build_market_package(fixture_info, selections_data, amount=1.0, currency="SOL")
 
     except Exception as e:
         logging.error(f"Error selecting option: {str(e)}")
@@ -152,41 +159,9 @@ async def market_finalized(
     try:
         # 공통 함수를 사용하여 경기 정보 가져오기
         fixture_info = await get_formatted_fixture_data(fixture_id)
-        
-        # 직렬화 가능한 딕셔너리 생성(Enum 값 직접 설정)
-        data = {
-            "market": {
-                "title": f"{fixture_info['home_team_name']} vs {fixture_info['away_team_name']} Match Prediction",
-                "description": f"Prediction market for the match between {fixture_info['home_team_name']} and {fixture_info['away_team_name']} on {fixture_info['match_date']}",
-                "type": "binary",
-                "status": "draft",
-                "category": "sports",
-                "amount": amount,
-                "currency": currency,
-                "close_date": fixture_info['match_date'],
-                "created_at": datetime.now().isoformat(),
-            },
-            "selections": [
-                {
-                    "name": selection.name, 
-                    "type": selection.type.value, 
-                    "description": selection.description,
-                    "thumbnail": fixture_info['home_team_thumbnail'] if selection.type.value == "win" else fixture_info['away_team_thumbnail']
-                }
-                for selection in selections_data
-            ],
-            "selected_type": selected_type,
-
-            "event": {
-                "type": "football_match",
-                "fixture_id": fixture_id,
-                "home_team": {"id": fixture_info['home_team_id'], "name": fixture_info['home_team_name']},
-                "away_team": {"id": fixture_info['away_team_id'], "name": fixture_info['away_team_name']},
-                "league": {"id": fixture_info['league_id'], "name": fixture_info['league_name'], "country": fixture_info['league_country']},
-                "start_time": fixture_info['match_date'],
-                "venue": {"name": fixture_info['venue_name'], "city": fixture_info['venue_city']},
-            },
-        }
+
+        data = build_market_package(fixture_info, selections_data, amount=amount, currency=currency)
+        data["selected_type"] = selected_type
         return data
 
     except Exception as e:
@@ -196,14 +171,12 @@ async def market_finalized(
 
 # 도구 생성
 dp_asking_options = StructuredTool.from_function(
-    func=asking_options,
     name="dp_asking_options",
     description="Generates selectable options displayed in FE based on the game content. The returned values from this tool determine the options available for the user.",
     coroutine=asking_options
 )
 
 dp_market_finalized = StructuredTool.from_function(
-    func=market_finalized,
     name="dp_market_finalized",
     description="Display confirmed market informaion to the user. Be sure to obtain all necessary information from the user before using it.",
     coroutine=market_finalized
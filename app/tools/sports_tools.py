@@ -1,8 +1,80 @@
+import functools
 import logging
 
 from langchain.tools import StructuredTool
 
-from app.services.sports_service import get_fixtures, get_leagues, preprocess_sports_data, search_teams
+from app.services.sports_service import get_fixtures, get_leagues, get_teams_fixtures, preprocess_sports_data, search_teams
+
+
+def with_sports_artifact(search_func):
+    """
+    검색 결과에서 sports_data를 분리하여 (LLM용 content, FE용 artifact) 튜플로 반환하는 래퍼
+    sports_data는 FE 표시용이므로 LLM 프롬프트 토큰에서 제외됨
+
+    Args:
+        search_func: 검색 도구 함수
+
+    Returns:
+        content_and_artifact 형식으로 결과를 반환하는 함수
+    """
+    @functools.wraps(search_func)
+    async def wrapper(*args, **kwargs) -> tuple[dict, dict]:
+        result = await search_func(*args, **kwargs)
+        content = {key: value for key, value in result.items() if key != "sports_data"}
+        return content, result
+
+    return wrapper
+
+
+def _project_fixture_summary(fixture: dict) -> dict:
+    """
+    팀 검색 결과용 경기 요약
+    """
+    info = fixture["fixture"]
+    teams = fixture["teams"]
+    return {
+        "id": info["id"],
+        "date": info["date"],
+        "home_team": teams["home"]["name"],
+        "away_team": teams["away"]["name"],
+        "league": fixture["league"]["name"]
+    }
+
+
+def _project_fixture(fixture: dict) -> dict:
+    """
+    경기 검색 결과용 경기 정보
+    """
+    info = fixture["fixture"]
+    home = fixture["teams"]["home"]
+    away = fixture["teams"]["away"]
+    league = fixture["league"]
+    goals = fixture["goals"]
+    return {
+        "id": info["id"],
+        "date": info["date"],
+        "status": info["status"]["long"],
+        "home_team": {
+            "id": home["id"],
+            "name": home["name"],
+            "logo": home.get("logo")
+        },
+        "away_team": {
+            "id": away["id"],
+            "name": away["name"],
+            "logo": away.get("logo")
+        },
+        "league": {
+            "id": league["id"],
+            "name": league["name"],
+            "country": league.get("country")
+        },
+        "venue": info.get("venue", {}).get("name", "Unknown Venue"),
+        "score": {
+            "home": goals["home"],
+            "away": goals["away"]
+        } if goals["home"] is not None else None
+    }
 
 
 async def league_search(
@@ -86,11 +158,8 @@ async def team_search(
             teams = [team for team in teams if team.get("team", {}).get("league_id") == league_id]
 
         # Add team fixtures
-        fixtures = []
-        for team in teams[:3]:  # Limit to top 3 teams to avoid too many API calls
-            team_id = team["team"]["id"]
-            team_fixtures = await get_fixtures(team_id=team_id, upcoming=True)
-            fixtures.extend(team_fixtures)
+        team_ids = [team["team"]["id"] for team in teams[:3]]  # Limit to top 3 teams to avoid too many API calls
+        fixtures = await get_teams_fixtures(team_ids, upcoming=True)
 
         processed_data = {
             "teams": teams,
@@ -108,16 +177,7 @@ async def team_search(
                 }
                 for team in teams[:5]  # Limit to top 5 teams
             ],
-            "fixtures": [
-                {
-                    "id": fixture["fixture"]["id"],
-                    "date": fixture["fixture"]["date"],
-                    "home_team": fixture["teams"]["home"]["name"],
-                    "away_team": fixture["teams"]["away"]["name"],
-                    "league": fixture["league"]["name"]
-                }
-                for fixture in fixtures[:5]  # Limit to top 5 fixtures
-            ],
+            "fixtures": [_project_fixture_summary(fixture) for fixture in fixtures[:5]],  # Limit to top 5 fixtures
             "sports_data": preprocess_sports_data(processed_data)
         }
 
@@ -197,34 +257,7 @@ async def fixture_search(
 
         return {
             "message": f"Found {len(fixtures)} fixtures matching your criteria.",
-            "fixtures": [
-                {
-                    "id": fixture["fixture"]["id"],
-                    "date": fixture["fixture"]["date"],
-                    "status": fixture["fixture"]["status"]["long"],
-                    "home_team": {
-                        "id": fixture["teams"]["home"]["id"],
-                        "name": fixture["teams"]["home"]["name"],
-                        "logo": fixture["teams"]["home"].get("logo")
-                    },
-                    "away_team": {
-                        "id": fixture["teams"]["away"]["id"],
-                        "name": fixture["teams"]["away"]["name"],
-                        "logo": fixture["teams"]["away"].get("logo")
-                    },
-                    "league": {
-                        "id": fixture["league"]["id"],
-                        "name": fixture["league"]["name"],
-                        "country": fixture["league"].get("country")
-                    },
-                    "venue": fixture["fixture"].get("venue", {}).get("name", "Unknown Venue"),
-                    "score": {
-                        "home": fixture["goals"]["home"],
-                        "away": fixture["goals"]["away"]
-                    } if fixture["goals"]["home"] is not None else None
-                }
-                for fixture in fixtures[:10]  # Limit to top 10 fixtures
-            ],
+            "fixtures": [_project_fixture(fixture) for fixture in fixtures[:10]],  # Limit to top 10 fixtures
             "sports_data": preprocess_sports_data(processed_data)
         }
 
@@ -238,22 +271,22 @@ async def fixture_search(
 
 # 도구 생성
 league_search_tool = StructuredTool.from_function(
-    func=league_search,
     name="league_search",
     description="Search for sports leagues by name or country. Use when the user wants to find information about leagues.",
-    coroutine=league_search
+    coroutine=with_sports_artifact(league_search),
+    response_format="content_and_artifact"
 )
 
 team_search_tool = StructuredTool.from_function(
-    func=team_search,
     name="team_search",
     description="Search for sports teams by name and their upcoming fixtures. Use when the user wants to find information about teams.",
-    coroutine=team_search
+    coroutine=with_sports_artifact(team_search),
+    response_format="content_and_artifact"
 )
 
 fixture_search_tool = StructuredTool.from_function(
-    func=fixture_search,
     name="fixture_search",
     description="Search for sports fixtures (matches) by date, team, league, or fixture ID. Use when the user wants to find specific matches.",
-    coroutine=fixture_search
+    coroutine=with_sports_artifact(fixture_search),
+    response_format="content_and_artifact"
 )
@@ -1,5 +1,3 @@
-import logging
-
 from langchain_core.tools import StructuredTool
 
 
@@ -24,23 +22,16 @@ async def token_bridge_finalized(
         Dictionary containing the bridge information
     """
 
-    try:
-        data = {
-            "from_network": from_network,
-            "from_asset": from_asset,
-            "amount": amount,
-            "to_network": to_network,
-            "to_asset": to_asset,
-        }
-        return data
-
-    except Exception as e:
-        logging.error(f"Error token_bridge_finalized: {str(e)}")
-        return {"error": str(e)}
+    return {
+        "from_network": from_network,
+        "from_asset": from_asset,
+        "amount": amount,
+        "to_network": to_network,
+        "to_asset": to_asset,
+    }
 
 
 dp_token_bridge_finalized = StructuredTool.from_function(
-    func=token_bridge_finalized,
     name="dp_token_bridge_finalized",
     description="Display confirmed token bridge info to the user. Be sure to obtain all necessary information from the user before using it.",
     coroutine=token_bridge_finalized